@@ -1,4 +1,3 @@
-contents=
 # bot.py
 import os
 import asyncio
@@ -10,29 +9,26 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-from utils.api import PteroAPI
-from utils.checks import admin_check
+from utils.admin_log import AdminLog
+from utils.api import PteroAPI, DEFAULT_HEADERS, json_dumps
+from utils.checks import ADMIN_IDS
 from utils.embeds import EmbedFactory
 
-# Cogs
-from cogs.servers import ServersCog
-from cogs.users import UsersCog
-from cogs.panel import PanelCog
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("pterobot")
 
 DISCORD_TOKEN = os.environ.get("DISCORD_TOKEN")
 PTERO_PANEL_URL = os.environ.get("PTERO_PANEL_URL", "https://panel.example.com")
-ADMIN_IDS = [int(x.strip()) for x in os.environ.get("ADMIN_IDS", "").split(",") if x.strip().isdigit()]
 ADMIN_LOG_CHANNEL_ID = int(os.environ.get("ADMIN_LOG_CHANNEL_ID", "0"))
 
 if not DISCORD_TOKEN:
     logger.error("DISCORD_TOKEN not set in environment.")
     raise SystemExit(1)
 
-intents = discord.Intents.default()
-intents.members = True  # needed to DM members and see mentions
+# Slash commands only need guild/channel data. Member options arrive resolved in the
+# interaction payload and can be DMed without the privileged members intent.
+intents = discord.Intents.none()
+intents.guilds = True
 
 class PteroBot(commands.Bot):
     def __init__(self):
@@ -45,19 +41,39 @@ class PteroBot(commands.Bot):
         self.session: Optional[aiohttp.ClientSession] = None
         self.ptero: Optional[PteroAPI] = None
         self.embed = EmbedFactory()
-        self.admin_ids = set(ADMIN_IDS)
-        self.admin_log_channel_id = ADMIN_LOG_CHANNEL_ID
+        self.admin_ids: frozenset[int] = ADMIN_IDS
+        self.admin_log = AdminLog(self, ADMIN_LOG_CHANNEL_ID)
 
     async def setup_hook(self):
-        # create shared aiohttp session and Pterodactyl API helper
-        self.session = aiohttp.ClientSession()
+        # create shared aiohttp session and Pterodactyl API helper; the pooled
+        # connector keeps TCP/TLS connections to the panel alive between commands
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        self.session = aiohttp.ClientSession(
+            headers=DEFAULT_HEADERS,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            json_serialize=json_dumps
+        )
         self.ptero = PteroAPI(self.session)
+        self.admin_log.start()
 
-        # register cogs
+        # register cogs; imported here so their modules load after the event loop is up
+        from cogs.servers import ServersCog
+        from cogs.users import UsersCog
+        from cogs.panel import PanelCog
         await self.add_cog(ServersCog(self))
         await self.add_cog(UsersCog(self))
         await self.add_cog(PanelCog(self))
 
+        # report check failures and errors through the (possibly deferred) interaction
+        self.tree.error(self.on_app_command_error)
+
         # sync commands
         logger.info("Syncing application commands...")
         await self.tree.sync()
@@ -66,11 +82,37 @@ class PteroBot(commands.Bot):
         logger.info(f"Logged in as {self.user} ({self.user.id})")
         logger.info(f"Admin IDs: {sorted(self.admin_ids)}")
 
+    async def on_app_command_completion(self, interaction: discord.Interaction, command: app_commands.Command):
+        elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds() * 1000
+        logger.info(f"⏱️ /{command.qualified_name}: total={elapsed:.0f}ms")
+
+    async def on_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        if isinstance(error, app_commands.CommandOnCooldown):
+            embed = self.embed.error(f"Rate limited, retry in {error.retry_after:.0f}s.")
+        elif isinstance(error, app_commands.CheckFailure):
+            embed = self.embed.error("You are not allowed to use this command.")
+        else:
+            logger.error(f"Command {interaction.command.name if interaction.command else '?'} failed", exc_info=error)
+            embed = self.embed.error("Something went wrong while running this command.")
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
     async def close(self):
+        # post queued admin logs while the Discord connection is still up
+        await self.admin_log.close()
         if self.session:
             await self.session.close()
         await super().close()
 
+# Use uvloop's faster event loop when it is installed (optional, not available on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 bot = PteroBot()
 
 # Run bot
@@ -6,150 +6,161 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from utils.api import PteroAPI, PteroError
+from utils.api import PartialResult, PteroAPI, PteroError, attr
 from utils.embeds import EmbedFactory
-from utils.checks import admin_check
+from utils.checks import admin_check, admin_cooldown
+from utils.mixins import PteroCallMixin
 
 logger = logging.getLogger("pterobot.panel")
 
-class PanelCog(commands.Cog):
+def _missing_nests(eggs: list) -> Optional[str]:
+    """Warning line for an egg listing that lacks the eggs of nests that failed to load."""
+    if isinstance(eggs, PartialResult):
+        return f"⚠️ Eggs of nest(s) {', '.join(map(str, eggs.failed))} could not be loaded; try again shortly."
+    return None
+
+# /manage panel components
+class _ManageNodeSelect(discord.ui.Select):
+    def __init__(self, ptero: PteroAPI, embed: EmbedFactory):
+        self.ptero = ptero
+        self.embed = embed
+        options = [discord.SelectOption(label="List Nodes", description="Show nodes", value="nodes"),
+                   discord.SelectOption(label="List Eggs", description="Show eggs", value="eggs")]
+        super().__init__(placeholder="Select an action...", min_values=1, max_values=1, options=options)
+
+    async def callback(self, intra: discord.Interaction):
+        val = self.values[0]
+        # Listings can page, fan out and back off past the 3s component window, so acknowledge first
+        await intra.response.defer()
+        if val == "nodes":
+            try:
+                nodes = await self.ptero.list_nodes()
+                e = self.embed.info_fields("Nodes", [{"name": attr(n, "name"), "value": f"ID: {attr(n, 'id', '')}", "inline": False} for n in nodes])
+                await intra.edit_original_response(embed=e, view=None)
+            except PteroError as ex:
+                await intra.edit_original_response(embed=self.embed.error(str(ex)), view=None)
+        elif val == "eggs":
+            try:
+                eggs = await self.ptero.list_eggs()
+                e = self.embed.info_fields("Eggs", [{"name": attr(egg, "name"), "value": f"ID: {attr(egg, 'id', '')}", "inline": False} for egg in eggs],
+                                           description=_missing_nests(eggs))
+                await intra.edit_original_response(embed=e, view=None)
+            except PteroError as ex:
+                await intra.edit_original_response(embed=self.embed.error(str(ex)), view=None)
+
+class _ManageRefreshButton(discord.ui.Button):
+    def __init__(self, ptero: PteroAPI, embed: EmbedFactory):
+        self.ptero = ptero
+        self.embed = embed
+        super().__init__(style=discord.ButtonStyle.primary, label="Refresh")
+
+    async def callback(self, intra: discord.Interaction):
+        # Drop cached node/egg data so the next listing comes straight from the panel
+        self.ptero.invalidate_cache("node")
+        self.ptero.invalidate_cache("egg")
+        await intra.response.edit_message(embed=self.embed.info("Refreshed."), view=self.view)
+
+class PanelCog(PteroCallMixin, commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.ptero: PteroAPI = bot.ptero
         self.embed = bot.embed
-        self.admin_log_channel_id = bot.admin_log_channel_id
+        # Static replies are built once; discord.py only serializes them on send
+        self._pong_embed = self.embed.info("Pong!")
+        self._help_embed = self.embed.info("Commands available. Use the slash command autocomplete for parameters.")
 
     @app_commands.command(name="nodes", description="List panel nodes")
+    @admin_cooldown()
     @admin_check()
     async def nodes(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        try:
-            nodes = await self.ptero.list_nodes()
-        except PteroError as e:
-            return await interaction.followup.send(embed=self.embed.error(f"Failed to list nodes: {e}"), ephemeral=True)
-        embed = self.embed.info("Nodes")
-        for n in nodes:
-            embed.add_field(name=n.get("name", n.get("attributes", {}).get("name","unknown")), value=f"ID: {n.get('id', n.get('attributes', {}).get('id',''))}", inline=False)
+        nodes = await self._safe(interaction, self.ptero.list_nodes(), "Failed to list nodes")
+        if nodes is None:
+            return
+        fields = [{"name": attr(n, "name"), "value": f"ID: {attr(n, 'id', '')}", "inline": False} for n in nodes]
+        embed = self.embed.info_fields("Nodes", fields)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="eggs", description="List eggs")
+    @admin_cooldown()
     @admin_check()
     async def eggs(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        try:
-            eggs = await self.ptero.list_eggs()
-        except PteroError as e:
-            return await interaction.followup.send(embed=self.embed.error(f"Failed to list eggs: {e}"), ephemeral=True)
-        embed = self.embed.info("Eggs")
-        for e in eggs:
-            embed.add_field(name=e.get("name", e.get("attributes", {}).get("name","unknown")), value=f"ID: {e.get('id', e.get('attributes', {}).get('id',''))}", inline=False)
+        eggs = await self._safe(interaction, self.ptero.list_eggs(), "Failed to list eggs")
+        if eggs is None:
+            return
+        fields = [{"name": attr(e, "name"), "value": f"ID: {attr(e, 'id', '')}", "inline": False} for e in eggs]
+        embed = self.embed.info_fields("Eggs", fields, description=_missing_nests(eggs))
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="panel_status", description="Check panel status")
+    @admin_cooldown()
     @admin_check()
     async def panel_status(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        try:
-            status = await self.ptero.panel_status()
-        except PteroError as e:
-            return await interaction.followup.send(embed=self.embed.error(f"Failed to get panel status: {e}"), ephemeral=True)
+        status = await self._safe(interaction, self.ptero.panel_status(), "Failed to get panel status")
+        if status is None:
+            return
         embed = self.embed.info("Panel Status")
         embed.add_field(name="Status", value=status, inline=True)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="maintenance_on", description="Turn on maintenance mode")
     @app_commands.describe(reason="Optional reason to show")
+    @admin_cooldown()
     @admin_check()
     async def maintenance_on(self, interaction: discord.Interaction, reason: Optional[str] = None):
-        await interaction.response.defer(ephemeral=True)
+        # PteroAPI.maintenance_on/off currently always raise PteroError: the panel API has no such switch
         try:
             await self.ptero.maintenance_on()
         except PteroError as e:
             return await interaction.followup.send(embed=self.embed.error(f"Failed to enable maintenance: {e}"), ephemeral=True)
         embed = self.embed.warning("🔧 Maintenance Enabled", description=reason or "Maintenance mode enabled on the panel.")
         # Maintenance may be panel-level; not server-specific: still notify admin channel
-        await self.bot.get_channel(self.admin_log_channel_id).send(embed=embed) if self.admin_log_channel_id else None
+        self.bot.admin_log.log(embed=embed)
         await interaction.followup.send(embed=self.embed.success("Maintenance enabled."), ephemeral=True)
 
     @app_commands.command(name="maintenance_off", description="Turn off maintenance mode")
+    @admin_cooldown()
     @admin_check()
     async def maintenance_off(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
         try:
             await self.ptero.maintenance_off()
         except PteroError as e:
             return await interaction.followup.send(embed=self.embed.error(f"Failed to disable maintenance: {e}"), ephemeral=True)
         embed = self.embed.success("🔧 Maintenance Disabled", description="Maintenance mode disabled on the panel.")
-        await self.bot.get_channel(self.admin_log_channel_id).send(embed=embed) if self.admin_log_channel_id else None
+        self.bot.admin_log.log(embed=embed)
         await interaction.followup.send(embed=self.embed.success("Maintenance disabled."), ephemeral=True)
 
     @app_commands.command(name="backup_list", description="List backups for a server")
     @app_commands.describe(server_id="Server ID")
+    @admin_cooldown()
     @admin_check()
     async def backup_list(self, interaction: discord.Interaction, server_id: str):
-        await interaction.response.defer(ephemeral=True)
-        try:
-            backups = await self.ptero.list_backups(server_id)
-        except PteroError as e:
-            return await interaction.followup.send(embed=self.embed.error(f"Failed to list backups: {e}"), ephemeral=True)
-        embed = self.embed.info(f"Backups for {server_id}")
-        if backups:
-            for b in backups:
-                embed.add_field(name=b.get("attributes", {}).get("filename", "backup"), value=f"ID: {b.get('id')}", inline=False)
-        else:
+        backups = await self._safe(interaction, self.ptero.list_backups(server_id), "Failed to list backups")
+        if backups is None:
+            return
+        fields = [{"name": attr(b, "filename", "backup"), "value": f"ID: {attr(b, 'id', None)}", "inline": False} for b in backups]
+        embed = self.embed.info_fields(f"Backups for {server_id}", fields)
+        if not fields:
             embed.description = "No backups found."
         await interaction.followup.send(embed=embed, ephemeral=True)
 
     # Utility commands
     @app_commands.command(name="ping", description="Ping the bot")
     async def ping(self, interaction: discord.Interaction):
-        await interaction.response.send_message(embed=self.embed.info("Pong!"), ephemeral=True)
+        await interaction.response.defer(ephemeral=True)
+        await interaction.followup.send(embed=self._pong_embed, ephemeral=True)
 
     @app_commands.command(name="help", description="Show help")
     async def help(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
         # Provide a short overview and direct to docs
-        await interaction.response.send_message(embed=self.embed.info("Commands available. Use the slash command autocomplete for parameters."), ephemeral=True)
+        await interaction.followup.send(embed=self._help_embed, ephemeral=True)
 
     @app_commands.command(name="manage", description="Open interactive management panel")
+    @admin_cooldown()
     @admin_check()
     async def manage(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
         # Provide Buttons and a Select menu example
         view = discord.ui.View(timeout=120)
-        class NodeSelect(discord.ui.Select):
-            def __init__(self):
-                options = [discord.SelectOption(label="List Nodes", description="Show nodes", value="nodes"),
-                           discord.SelectOption(label="List Eggs", description="Show eggs", value="eggs")]
-                super().__init__(placeholder="Select an action...", min_values=1, max_values=1, options=options)
-
-            async def callback(self, intra: discord.Interaction):
-                val = self.values[0]
-                if val == "nodes":
-                    try:
-                        nodes = await self.ptero.list_nodes()
-                        e = self.embed.info("Nodes")
-                        for n in nodes:
-                            e.add_field(name=n.get("name", "unknown"), value=f"ID: {n.get('id')}", inline=False)
-                        await intra.response.edit_message(embed=e, view=None)
-                    except PteroError as ex:
-                        await intra.response.edit_message(embed=self.embed.error(str(ex)), view=None)
-                elif val == "eggs":
-                    try:
-                        eggs = await self.ptero.list_eggs()
-                        e = self.embed.info("Eggs")
-                        for egg in eggs:
-                            e.add_field(name=egg.get("name", "unknown"), value=f"ID: {egg.get('id')}", inline=False)
-                        await intra.response.edit_message(embed=e, view=None)
-                    except PteroError as ex:
-                        await intra.response.edit_message(embed=self.embed.error(str(ex)), view=None)
-
-        class RefreshButton(discord.ui.Button):
-            def __init__(self):
-                super().__init__(style=discord.ButtonStyle.primary, label="Refresh")
-
-            async def callback(self, intra: discord.Interaction):
-                await intra.response.edit_message(embed=self.embed.info("Refreshed."), view=view)
-
-        view.add_item(NodeSelect())
-        view.add_item(RefreshButton())
+        view.add_item(_ManageNodeSelect(self.ptero, self.embed))
+        view.add_item(_ManageRefreshButton(self.ptero, self.embed))
         await interaction.followup.send(embed=self.embed.info("Interactive management panel (expires in 120s)"), view=view, ephemeral=True)
@@ -0,0 +1,127 @@
+# utils/admin_log.py
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+import discord
+
+logger = logging.getLogger("pterobot.admin_log")
+
+# Entries are batched: up to LOG_BATCH_SIZE per flush, flushed at least every LOG_FLUSH_INTERVAL seconds
+LOG_BATCH_SIZE = 10
+LOG_FLUSH_INTERVAL = 1.0
+# Discord's per-message limits: content length, embed count and summed embed length
+LOG_MESSAGE_LIMIT = 2000
+LOG_EMBEDS_PER_MESSAGE = 10
+LOG_EMBED_CHARS = 6000
+# How long close() waits for queued entries to be posted before giving up on them
+LOG_DRAIN_TIMEOUT = 10.0
+
+class AdminLog:
+    """
+    The bot's single path to the admin log channel. log() only queues; a background task posts
+    queued entries in batches so bursts of commands don't each cost a channel message.
+    """
+
+    def __init__(self, bot: discord.Client, channel_id: int):
+        self.bot = bot
+        self.channel_id = channel_id
+        self._channel: Optional[discord.abc.Messageable] = None
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.channel_id and self._task is None:
+            self._task = asyncio.create_task(self._flush())
+
+    async def close(self):
+        if self._task:
+            # None tells the flusher to post everything queued before it and stop
+            self._queue.put_nowait(None)
+            try:
+                await asyncio.wait_for(self._task, LOG_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning(f"Gave up posting {self._queue.qsize()} queued admin log entries on shutdown.")
+            self._task = None
+
+    def log(self, content: Optional[str] = None, embed: Optional[discord.Embed] = None):
+        """Queue an admin log entry (text, embed or both); a no-op when no admin channel is configured."""
+        if self.channel_id:
+            self._queue.put_nowait((content, embed))
+
+    def _resolve_channel(self) -> Optional[discord.abc.Messageable]:
+        # Resolved once and reused (looked up again while get_channel returns None)
+        if self._channel is None:
+            self._channel = self.bot.get_channel(self.channel_id)
+        return self._channel
+
+    async def _flush(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await self._queue.get()
+            if entry is None:
+                return
+            batch = [entry]
+            stopping = False
+            deadline = loop.time() + LOG_FLUSH_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._post(batch)
+            if stopping:
+                return
+
+    async def _post(self, batch: List[Tuple[Optional[str], Optional[discord.Embed]]]):
+        channel = self._resolve_channel()
+        if not channel:
+            logger.warning(f"Admin log channel {self.channel_id} not found; dropped {len(batch)} log entries.")
+            return
+        # Text and embeds go in separate messages so a rejected embed can't take the text lines down with it
+        for content in self._pack_lines([c for c, _ in batch if c]):
+            await self._send(channel, content=content)
+        for embeds in self._pack_embeds([e for _, e in batch if e is not None]):
+            await self._send(channel, embeds=embeds)
+
+    @staticmethod
+    async def _send(channel: discord.abc.Messageable, **kwargs):
+        try:
+            await channel.send(**kwargs)
+        except Exception as e:
+            # Any failure (HTTP error, a channel that can't take messages, ...) must not stop the flusher
+            logger.warning(f"Failed to post admin log ({e!r}).")
+
+    @staticmethod
+    def _pack_lines(lines: List[str]) -> List[str]:
+        """Pack log lines into as few messages as fit LOG_MESSAGE_LIMIT, splitting any overlong line."""
+        messages, current = [], ""
+        pieces = [line[i:i + LOG_MESSAGE_LIMIT] for line in lines for i in range(0, len(line), LOG_MESSAGE_LIMIT)]
+        for piece in pieces:
+            if current and len(current) + 1 + len(piece) > LOG_MESSAGE_LIMIT:
+                messages.append(current)
+                current = piece
+            else:
+                current = f"{current}\n{piece}" if current else piece
+        if current:
+            messages.append(current)
+        return messages
+
+    @staticmethod
+    def _pack_embeds(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+        """Group embeds so each message stays within LOG_EMBEDS_PER_MESSAGE and LOG_EMBED_CHARS in total."""
+        groups, current, size = [], [], 0
+        for embed in embeds:
+            length = len(embed)
+            if current and (len(current) == LOG_EMBEDS_PER_MESSAGE or size + length > LOG_EMBED_CHARS):
+                groups.append(current)
+                current, size = [], 0
+            current.append(embed)
+            size += length
+        if current:
+            groups.append(current)
+        return groups
@@ -1,11 +1,31 @@
-```python
 # utils/api.py
 import os
 import aiohttp
 import asyncio
+import contextlib
+import functools
 import hashlib
+import inspect
+import json
+import logging
+import math
+import random
 import secrets
-from typing import Optional, Dict, Any, List
+import time
+from urllib.parse import quote
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: full scans are parsed in memory when ijson isn't installed
+    ijson = None
+
+logger = logging.getLogger("pterobot.api")
 
 PTERO_APP_API = os.environ.get("PTERO_APP_API")  # Application API key (Bearer)
 PTERO_CLIENT_API = os.environ.get("PTERO_CLIENT_API")  # (optional) Daemon API key if needed
@@ -14,83 +34,381 @@ PTERO_PANEL_URL = os.environ.get("PTERO_PANEL_URL", "https://panel.example.com")
 if not PTERO_APP_API:
     raise RuntimeError("PTERO_APP_API environment variable is required")
 
+# Sent with every panel request; installed once as the shared session's default headers
+DEFAULT_HEADERS = {
+    "Authorization": f"Bearer {PTERO_APP_API}",
+    "Accept": "application/json",
+    "Content-Type": "application/json"
+}
+
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        # aiohttp's json_serialize hook must return str
+        return orjson.dumps(obj).decode()
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# Application API endpoint paths; _req prefixes them with the panel URL
+API_PATH = "/api/application"
+USERS_PATH = f"{API_PATH}/users"
+SERVERS_PATH = f"{API_PATH}/servers"
+NODES_PATH = f"{API_PATH}/nodes"
+NESTS_PATH = f"{API_PATH}/nests"
+EGGS_PATH = f"{API_PATH}/eggs"
+
+# How long node/egg lookups are served from memory before hitting the panel again. Server changes don't
+# invalidate them: only names/IDs are used, and /manage Refresh clears them on demand
+CACHE_TTL = 300.0
+# Users and backups change more often, so their listings expire sooner
+CACHE_TTL_SHORT = 60.0
+# Upper bound on cached entries; the oldest entry is evicted once it is reached
+CACHE_MAX_ENTRIES = 1024
+
+# Retry policy for rate limits (429) and transient panel failures
+RETRY_ATTEMPTS = 3
+RETRY_BASE = 1.0
+RETRY_CAP = 30.0
+RETRY_JITTER = 0.5
+RETRY_STATUSES = {502, 503, 504}
+# Transport failures retried for idempotent methods; a dropped keep-alive connection shows up as the first two
+RETRY_ERRORS = (aiohttp.ServerDisconnectedError, aiohttp.ClientOSError, asyncio.TimeoutError)
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+# Requests allowed in flight against the panel at once; further calls wait for a slot
+MAX_IN_FLIGHT = 8
+# Page size requested by streamed full scans (the panel may cap it lower)
+SCAN_PAGE_SIZE = 100
+
 class PteroError(Exception):
     pass
 
+def attr(resource: Dict[str, Any], key: str, default: Any = "unknown") -> Any:
+    """Read `key` from a panel resource, falling back to its nested "attributes" dict."""
+    value = resource.get(key)
+    if value is None:
+        attributes = resource.get("attributes")
+        if attributes:
+            value = attributes.get(key)
+    return default if value is None else value
+
+class PartialResult(list):
+    """A listing missing the items of some failed requests; `failed` names what is missing. Never cached."""
+
+    def __init__(self, items: List[Any], failed: List[Any]):
+        super().__init__(items)
+        self.failed = failed
+
+class TTLCache:
+    """
+    Small in-memory cache of key -> (expiry, value) with a lock per key to coalesce concurrent misses.
+    A key's lock only exists while some caller holds or waits on it, so failed fetches, expired entries
+    and invalidations never leave locks behind.
+    """
+
+    def __init__(self, ttl: float = CACHE_TTL, maxsize: int = CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Tuple, Tuple[float, Any]] = {}
+        # key -> [lock, number of callers holding or waiting on it]
+        self._locks: Dict[Tuple, List[Any]] = {}
+
+    def get(self, key: Tuple) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Tuple, value: Any, ttl: Optional[float] = None):
+        now = time.monotonic()
+        # Re-insert so dict order stays oldest-first
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            for k in [k for k, (expires, _) in self._data.items() if expires <= now]:
+                del self._data[k]
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (now + (self.ttl if ttl is None else ttl), value)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, key: Tuple):
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    def invalidate(self, kind: Optional[str] = None):
+        """Drop every entry, or only those whose key starts with `kind` (e.g. "node")."""
+        if kind is None:
+            self._data.clear()
+            return
+        for key in [k for k in self._data if k[0] == kind]:
+            del self._data[key]
+
+def informational_cache(kind: str, ttl: Optional[float] = None):
+    """
+    Cache a read-only PteroAPI method in the instance's TTLCache under (kind, name, bound arguments).
+    Arguments are bound to the signature with defaults applied, so f(), f(1) and f(page=1) share an entry.
+    Only decorate GETs; a method that changes what a cached kind returns must call invalidate_cache(kind).
+    Every caller gets the same cached list/dict object: treat results as read-only and copy before mutating.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(self: "PteroAPI", *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (kind, fn.__name__, tuple(bound.arguments.values())[1:])
+            return await self._cached(key, lambda: fn(self, *args, **kwargs), ttl)
+        return wrapper
+    return decorator
+
 class PteroAPI:
+    """
+    Pterodactyl Application API helper.
+    The session must be created with headers=DEFAULT_HEADERS; requests rely on it for authentication.
+    It must also be long-lived and shared (one per bot, closed on shutdown): its connection pool is what
+    keeps TCP/TLS connections to the panel alive between calls, so never create a session per request.
+    """
+
     def __init__(self, session: aiohttp.ClientSession):
         self.session = session
+        self._cache = TTLCache()
+        self._in_flight = asyncio.Semaphore(MAX_IN_FLIGHT)
         self.base_url = PTERO_PANEL_URL
-        self.headers = {
-            "Authorization": f"Bearer {PTERO_APP_API}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
 
     @staticmethod
     def generate_password(length: int = 16) -> str:
-        return secrets.token_urlsafe(length)[:length]
+        # os.urandom + base64 only (~1µs), so it is safe to call directly on the event loop.
+        # Each random byte yields 4/3 base64 chars, so read just enough bytes to cover length
+        return secrets.token_urlsafe(math.ceil(length * 3 / 4))[:length]
+
+    # --- Request helpers ---
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[str] = None) -> float:
+        delay = min(RETRY_BASE * 2 ** attempt * (1 + random.random() * RETRY_JITTER), RETRY_CAP)
+        # RETRY_CAP only bounds our own backoff; retrying before the panel's Retry-After just earns another 429
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay
+
+    @contextlib.asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs):
+        """
+        Send a request and yield the response, retrying 429s and transient failures with jittered backoff.
+        5xx responses, timeouts and dropped connections are only retried for idempotent methods so a POST is
+        never applied twice. Any other status is handed back to the caller unchanged; transport errors that
+        are not retried, or still fail after the last attempt, raise PteroError.
+        """
+        idempotent = method in IDEMPOTENT_METHODS
+        for attempt in range(RETRY_ATTEMPTS):
+            last = attempt == RETRY_ATTEMPTS - 1
+            # The slot stays held until the body has been read and the connection released,
+            # but is given back while backing off between attempts
+            async with self._in_flight:
+                try:
+                    r = await self.session.request(method, url, **kwargs)
+                except RETRY_ERRORS as e:
+                    # A refused connection never reached the panel, so it is safe to resend any method
+                    if last or not (idempotent or isinstance(e, aiohttp.ClientConnectorError)):
+                        raise PteroError(f"Panel request failed: {str(e) or type(e).__name__}") from e
+                    delay = self._backoff(attempt)
+                except aiohttp.ClientError as e:
+                    raise PteroError(f"Panel request failed: {str(e) or type(e).__name__}") from e
+                else:
+                    if last or not (r.status == 429 or (idempotent and r.status in RETRY_STATUSES)):
+                        try:
+                            yield r
+                        except aiohttp.ClientError as e:
+                            # The connection can still drop while the caller reads the body
+                            raise PteroError(f"Reading panel response failed: {str(e) or type(e).__name__}") from e
+                        finally:
+                            r.release()
+                        return
+                    delay = self._backoff(attempt, r.headers.get("Retry-After"))
+                    r.release()
+            await asyncio.sleep(delay)
+
+    async def _req(self, method: str, path: str, *, expect_json: bool = True, error: Optional[str] = None, **kwargs) -> Any:
+        """
+        Send a request to `path` on the panel and return the decoded JSON body (None for 204 or expect_json=False).
+        Any 4xx/5xx left after retries raises PteroError prefixed with `error`.
+        """
+        async with self._request(method, f"{self.base_url}{path}", **kwargs) as r:
+            await self._raise_for_status(r, method, path, error)
+            if expect_json and r.status != 204:
+                return await r.json(loads=json_loads)
+            return None
+
+    @staticmethod
+    async def _raise_for_status(r: aiohttp.ClientResponse, method: str, path: str, error: Optional[str] = None):
+        if r.status >= 400:
+            text = await r.text()
+            raise PteroError(f"{error or f'{method} {path} failed'}: status {r.status}: {text}")
+
+    async def _get_page(self, path: str, page: int) -> Dict[str, Any]:
+        sep = "&" if "?" in path else "?"
+        return await self._req("GET", f"{path}{sep}page={page}", error=f"Fetching {path} page {page} failed")
+
+    async def _get_all_pages(self, path: str) -> List[Dict[str, Any]]:
+        """Fetch page 1, then every remaining page concurrently, and return the combined `data` items."""
+        first = await self._get_page(path, 1)
+        total_pages = first.get("meta", {}).get("pagination", {}).get("total_pages", 1)
+        pages = [first]
+        if total_pages > 1:
+            pages += await asyncio.gather(*(self._get_page(path, p) for p in range(2, total_pages + 1)))
+        return [item for page in pages for item in page.get("data", [])]
+
+    async def _get_filtered(self, path: str, fields: Tuple[str, ...], query: str) -> List[Dict[str, Any]]:
+        """Ask the panel to filter `path` on each field concurrently; returns the merged items, deduplicated by id."""
+        q = quote(query, safe="")
+        results = await asyncio.gather(*(self._get_all_pages(f"{path}?filter[{f}]={q}") for f in fields), return_exceptions=True)
+        merged = {}
+        for f, items in zip(fields, results):
+            if isinstance(items, Exception):
+                logger.warning(f"Filtering {path} on {f} failed: {items}")
+                continue
+            for item in items:
+                merged.setdefault(attr(item, "id", None), item)
+        return list(merged.values())
+
+    async def _scan(self, path: str, match: Callable[[Dict[str, Any]], bool]) -> Optional[Dict[str, Any]]:
+        """
+        Return the attributes of the first item on any page of `path` that satisfies `match`, or None.
+        With ijson installed pages are parsed as they stream in and the scan stops at the first hit;
+        otherwise every page is fetched and matched in memory.
+        """
+        if ijson is None:
+            for item in await self._get_all_pages(path):
+                a = item.get("attributes", item)
+                if match(a):
+                    return a
+            return None
+        page, total_pages = 1, None
+        while True:
+            count = 0
+            url = f"{self.base_url}{path}?page={page}&per_page={SCAN_PAGE_SIZE}"
+            async with self._request("GET", url) as r:
+                await self._raise_for_status(r, "GET", path, f"Fetching {path} page {page} failed")
+                # Build each data item from the event stream while also picking up meta.pagination.total_pages
+                builder = None
+                async for prefix, event, value in ijson.parse_async(r.content):
+                    if builder is not None:
+                        builder.event(event, value)
+                        if prefix == "data.item" and event == "end_map":
+                            a = builder.value.get("attributes", builder.value)
+                            builder = None
+                            count += 1
+                            if match(a):
+                                return a
+                    elif prefix == "data.item" and event == "start_map":
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == "meta.pagination.total_pages":
+                        total_pages = value
+            # Trust the reported page count; without one, keep going until a page comes back empty
+            if not count or (total_pages is not None and page >= total_pages):
+                return None
+            page += 1
+
+    # --- Cache helpers ---
+    async def _cached(self, key: Tuple, fetch: Callable[[], Awaitable[Any]], ttl: Optional[float] = None) -> Any:
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+        # Only the first caller for a key hits the panel; the rest wait and reuse its result
+        async with self._cache.lock(key):
+            value = self._cache.get(key)
+            if value is None:
+                value = await fetch()
+                # A partial listing is handed back once but not kept, so the next call retries the failed part
+                if not isinstance(value, PartialResult):
+                    self._cache.set(key, value, ttl)
+            return value
+
+    def invalidate_cache(self, kind: Optional[str] = None):
+        self._cache.invalidate(kind)
 
     # --- Node & Egg helpers ---
+    @informational_cache("node")
     async def get_node(self, node_id: int) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/application/nodes/{node_id}"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status == 200:
-                resp = await r.json()
-                return resp.get("attributes", resp)
-            raise PteroError(f"Node {node_id} not found (status {r.status})")
+        resp = await self._req("GET", f"{NODES_PATH}/{node_id}", error=f"Node {node_id} not found")
+        return resp.get("attributes", resp)
 
+    @informational_cache("egg")
     async def get_egg(self, egg_id: int) -> Dict[str, Any]:
         # The Pterodactyl API typically exposes eggs via: /api/application/nests/{nest_id}/eggs/{egg_id}
         # Many panels also allow /api/application/eggs/{egg_id}
-        url = f"{self.base_url}/api/application/nests"
         # Try a direct eggs endpoint first
         try:
-            url_direct = f"{self.base_url}/api/application/eggs/{egg_id}"
-            async with self.session.get(url_direct, headers=self.headers) as r:
-                if r.status == 200:
-                    resp = await r.json()
-                    return resp.get("attributes", resp)
+            resp = await self._req("GET", f"{EGGS_PATH}/{egg_id}")
+            return resp.get("attributes", resp)
         except Exception:
             pass
-        # Fallback: list nests and search eggs
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status != 200:
-                raise PteroError("Unable to fetch nests to validate egg")
-            nests = await r.json()
-            for n in nests.get("data", []):
-                nest_id = n.get("attributes", {}).get("id")
-                if not nest_id:
-                    continue
-                eggs_url = f"{self.base_url}/api/application/nests/{nest_id}/eggs"
-                async with self.session.get(eggs_url, headers=self.headers) as er:
-                    if er.status != 200:
-                        continue
-                    eggs = await er.json()
-                    for egg in eggs.get("data", []):
-                        if egg.get("attributes", {}).get("id") == egg_id or egg.get("id") == egg_id:
-                            return egg.get("attributes", egg)
+        # Fallback: search every nest's eggs concurrently and stop at the first match
+        try:
+            nest_ids = await self._fetch_nest_ids()
+        except PteroError as e:
+            raise PteroError(f"Unable to fetch nests to validate egg ({e})") from e
+        failed = []
+
+        async def nest_eggs(nid: int) -> List[Dict[str, Any]]:
+            try:
+                return await self._fetch_nest_eggs(nid)
+            except PteroError as e:
+                logger.warning(f"Skipping eggs of nest {nid}: {e}")
+                failed.append(nid)
+                return []
+
+        tasks = [asyncio.create_task(nest_eggs(nid)) for nid in nest_ids]
+        try:
+            for done in asyncio.as_completed(tasks):
+                for egg in await done:
+                    if attr(egg, "id", None) == egg_id:
+                        return egg.get("attributes", egg)
+        finally:
+            for task in tasks:
+                task.cancel()
+        if failed:
+            # The egg may live in a nest we couldn't read, so don't claim it doesn't exist
+            raise PteroError(f"Egg {egg_id} not found in the nests that loaded; nest(s) {', '.join(map(str, failed))} failed to load")
         raise PteroError(f"Egg {egg_id} not found")
 
+    async def _fetch_nest_ids(self) -> List[int]:
+        nests = await self._get_all_pages(NESTS_PATH)
+        return [nid for nid in (attr(n, "id", None) for n in nests) if nid]
+
+    async def _fetch_nest_eggs(self, nest_id: int) -> List[Dict[str, Any]]:
+        return await self._get_all_pages(f"{NESTS_PATH}/{nest_id}/eggs")
+
     # --- User helpers ---
     async def find_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        url = f"{self.base_url}/api/application/users?filter[email]={email}"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status != 200:
-                # Fallback to listing and matching
-                users = await self.list_users()
-                for u in users.get("data", []):
-                    a = u.get("attributes", {})
-                    if a.get("email") == email:
-                        return a
-                return None
-            data = await r.json()
-            for u in data.get("data", []):
-                return u.get("attributes", u)
+        try:
+            data = await self._req("GET", f"{USERS_PATH}?filter[email]={quote(email, safe='')}")
+        except PteroError:
+            # Filter unsupported: scan every user page, stopping at the first match
+            return await self._scan(USERS_PATH, lambda a: a.get("email") == email)
+        for u in data.get("data", []):
+            return u.get("attributes", u)
         return None
 
     async def create_user(self, username: str, email: str, first_name: str, last_name: str, password: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/application/users"
         payload = {
             "username": username[:191],
             "email": email,
@@ -98,37 +416,24 @@ class PteroAPI:
             "last_name": last_name[:191],
             "password": password
         }
-        async with self.session.post(url, json=payload, headers=self.headers) as r:
-            if r.status in (200, 201):
-                data = await r.json()
-                return data.get("attributes", data)
-            else:
-                text = await r.text()
-                raise PteroError(f"Create user failed: status {r.status}: {text}")
+        data = await self._req("POST", USERS_PATH, json=payload, error="Create user failed")
+        self.invalidate_cache("user")
+        return data.get("attributes", data)
 
+    @informational_cache("user", CACHE_TTL_SHORT)
     async def list_users(self, page: int = 1) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/application/users?page={page}"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status == 200:
-                return await r.json()
-            raise PteroError(f"List users failed (status {r.status})")
+        return await self._req("GET", f"{USERS_PATH}?page={page}", error="List users failed")
 
     async def delete_user(self, user_id: int):
-        url = f"{self.base_url}/api/application/users/{user_id}"
-        async with self.session.delete(url, headers=self.headers) as r:
-            if r.status in (200, 204):
-                return True
-            text = await r.text()
-            raise PteroError(f"Delete user failed: status {r.status}: {text}")
+        await self._req("DELETE", f"{USERS_PATH}/{user_id}", expect_json=False, error="Delete user failed")
+        self.invalidate_cache("user")
+        return True
 
     async def change_user_password(self, user_id: int, password: str):
-        url = f"{self.base_url}/api/application/users/{user_id}/reset-password"
         payload = {"password": password, "password_confirmation": password}
-        async with self.session.post(url, json=payload, headers=self.headers) as r:
-            if r.status in (200, 204):
-                return True
-            text = await r.text()
-            raise PteroError(f"Change password failed: status {r.status}: {text}")
+        await self._req("POST", f"{USERS_PATH}/{user_id}/reset-password", json=payload, expect_json=False, error="Change password failed")
+        self.invalidate_cache("user")
+        return True
 
     # --- Server helpers ---
     async def create_server(self, name: str, user_id: int, egg_id: int, node_id: int, memory: int, cpu: int, disk: int, version: str) -> Dict[str, Any]:
@@ -136,7 +441,6 @@ class PteroAPI:
         Create a server. This tries to craft a typical payload compatible with Pterodactyl Application API.
         The API may vary; administrators should adapt fields like allocation if necessary.
         """
-        url = f"{self.base_url}/api/application/servers"
         payload = {
             "name": name[:191],
             "user": int(user_id),
@@ -156,64 +460,44 @@ class PteroAPI:
             "allocation": {}
         }
         # Note: allocation might be required by some panels; leaving allocation empty may cause failure.
-        async with self.session.post(url, json=payload, headers=self.headers) as r:
-            if r.status in (200, 201):
-                data = await r.json()
-                return data.get("attributes", data)
-            text = await r.text()
-            raise PteroError(f"Create server failed: status {r.status}: {text}")
+        data = await self._req("POST", SERVERS_PATH, json=payload, error="Create server failed")
+        return data.get("attributes", data)
 
     async def delete_server(self, server_id: str):
-        url = f"{self.base_url}/api/application/servers/{server_id}"
-        async with self.session.delete(url, headers=self.headers) as r:
-            if r.status in (200, 204):
-                return True
-            text = await r.text()
-            raise PteroError(f"Delete server failed: status {r.status}: {text}")
+        await self._req("DELETE", f"{SERVERS_PATH}/{server_id}", expect_json=False, error="Delete server failed")
+        self.invalidate_cache("backup")
+        return True
 
     async def suspend_server(self, server_id: str):
-        url = f"{self.base_url}/api/application/servers/{server_id}/suspend"
-        async with self.session.post(url, headers=self.headers) as r:
-            if r.status in (200, 204):
-                return True
-            text = await r.text()
-            raise PteroError(f"Suspend failed: status {r.status}: {text}")
+        await self._req("POST", f"{SERVERS_PATH}/{server_id}/suspend", expect_json=False, error="Suspend failed")
+        return True
 
     async def unsuspend_server(self, server_id: str):
-        url = f"{self.base_url}/api/application/servers/{server_id}/unsuspend"
-        async with self.session.post(url, headers=self.headers) as r:
-            if r.status in (200, 204):
-                return True
-            text = await r.text()
-            raise PteroError(f"Unsuspend failed: status {r.status}: {text}")
+        await self._req("POST", f"{SERVERS_PATH}/{server_id}/unsuspend", expect_json=False, error="Unsuspend failed")
+        return True
 
     async def get_server(self, server_id: str) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/application/servers/{server_id}"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status == 200:
-                return await r.json()
-            text = await r.text()
-            raise PteroError(f"Get server failed: status {r.status}: {text}")
+        return await self._req("GET", f"{SERVERS_PATH}/{server_id}", error="Get server failed")
 
     async def list_servers(self, page: int = 1) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/application/servers?page={page}"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status == 200:
-                return await r.json()
-            raise PteroError(f"List servers failed: status {r.status}")
+        return await self._req("GET", f"{SERVERS_PATH}?page={page}", error="List servers failed")
 
     async def search_servers(self, query: str) -> List[Dict[str, Any]]:
-        # Pterodactyl does not provide a universal search endpoint by default. This tries to do a basic scan.
-        all_pages = await self.list_servers(page=1)
-        results = []
-        for item in all_pages.get("data", []):
-            a = item.get("attributes", {})
-            if query.lower() in a.get("name", "").lower() or query.lower() in a.get("identifier", "").lower():
-                results.append(a)
+        # Pterodactyl has no universal search endpoint. Filter server-side by name/short identifier first and
+        # only scan every page if that finds nothing; matches are re-checked locally in case filters are ignored.
+        path = SERVERS_PATH
+        results = self._match_servers(await self._get_filtered(path, ("name", "uuidShort"), query), query)
+        if not results:
+            results = self._match_servers(await self._get_all_pages(path), query)
         return results
 
+    @staticmethod
+    def _match_servers(items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        q = query.lower()
+        return [a for a in (item.get("attributes", {}) for item in items)
+                if q in a.get("name", "").lower() or q in a.get("identifier", "").lower()]
+
     async def set_server_resources(self, server_id: str, memory: int, cpu: int, disk: int):
-        url = f"{self.base_url}/api/application/servers/{server_id}/build"
         payload = {
             "memory": int(memory),
             "swap": 0,
@@ -221,60 +505,67 @@ class PteroAPI:
             "io": 500,
             "cpu": int(cpu)
         }
-        async with self.session.patch(url, json=payload, headers=self.headers) as r:
-            if r.status in (200, 204):
-                return True
-            text = await r.text()
-            raise PteroError(f"Set resources failed: status {r.status}: {text}")
+        await self._req("PATCH", f"{SERVERS_PATH}/{server_id}/build", json=payload, expect_json=False, error="Set resources failed")
+        return True
 
     # --- Panel endpoints ---
+    @informational_cache("node")
     async def list_nodes(self):
-        url = f"{self.base_url}/api/application/nodes"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status == 200:
-                resp = await r.json()
-                return [d.get("attributes", d) for d in resp.get("data", [])]
-            raise PteroError("Failed to list nodes")
+        try:
+            nodes = await self._get_all_pages(NODES_PATH)
+        except PteroError as e:
+            raise PteroError(f"Failed to list nodes ({e})") from e
+        return [d.get("attributes", d) for d in nodes]
 
+    @informational_cache("egg")
     async def list_eggs(self):
-        url = f"{self.base_url}/api/application/nests"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status != 200:
-                raise PteroError("Failed to fetch nests/eggs")
-            resp = await r.json()
-            eggs = []
-            for n in resp.get("data", []):
-                nid = n.get("attributes", {}).get("id")
-                async with self.session.get(f"{self.base_url}/api/application/nests/{nid}/eggs", headers=self.headers) as er:
-                    if er.status != 200:
-                        continue
-                    eresp = await er.json()
-                    for e in eresp.get("data", []):
-                        eggs.append(e.get("attributes", e))
-            return eggs
+        try:
+            nest_ids = await self._fetch_nest_ids()
+        except PteroError as e:
+            raise PteroError(f"Failed to fetch nests/eggs ({e})") from e
+        # One request per nest, all in flight at once; a failing nest is skipped rather than failing the list,
+        # and the result is returned as an uncached PartialResult so callers can say what is missing
+        results = await asyncio.gather(*(self._fetch_nest_eggs(nid) for nid in nest_ids), return_exceptions=True)
+        eggs, failed = [], []
+        for nid, nest_eggs in zip(nest_ids, results):
+            if isinstance(nest_eggs, Exception):
+                logger.warning(f"Skipping eggs of nest {nid}: {nest_eggs}")
+                failed.append(nid)
+                continue
+            eggs.extend(e.get("attributes", e) for e in nest_eggs)
+        return PartialResult(eggs, failed) if failed else eggs
+
+    async def maintenance_on(self):
+        # The Application API has no panel-wide maintenance switch (only per-node maintenance_mode),
+        # so surface that to the command instead of pretending it succeeded
+        raise PteroError("Panel-wide maintenance mode is not available through the Pterodactyl Application API")
+
+    async def maintenance_off(self):
+        raise PteroError("Panel-wide maintenance mode is not available through the Pterodactyl Application API")
 
     async def panel_status(self) -> str:
         # Simple check: GET panel root or API health
-        async with self.session.get(f"{self.base_url}/api/application") as r:
+        async with self._request("GET", f"{self.base_url}{API_PATH}") as r:
             if r.status == 200:
                 return "OK"
             return f"Unclear (status {r.status})"
 
+    @informational_cache("backup", CACHE_TTL_SHORT)
     async def list_backups(self, server_id: str):
-        url = f"{self.base_url}/api/application/servers/{server_id}/backups"
-        async with self.session.get(url, headers=self.headers) as r:
-            if r.status == 200:
-                resp = await r.json()
-                return resp.get("data", [])
-            raise PteroError(f"List backups failed: status {r.status}")
+        resp = await self._req("GET", f"{SERVERS_PATH}/{server_id}/backups", error="List backups failed")
+        return resp.get("data", [])
 
     # --- Simple user search ---
     async def search_users(self, query: str):
-        users = await self.list_users(page=1)
-        matches = []
-        for u in users.get("data", []):
-            a = u.get("attributes", {})
-            if query.lower() in a.get("username", "").lower() or query.lower() in a.get("email", "").lower():
-                matches.append(a)
+        # Same approach as search_servers: server-side email/username filters, full scan as the fallback
+        path = USERS_PATH
+        matches = self._match_users(await self._get_filtered(path, ("email", "username"), query), query)
+        if not matches:
+            matches = self._match_users(await self._get_all_pages(path), query)
         return matches
-```
+
+    @staticmethod
+    def _match_users(items: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        q = query.lower()
+        return [a for a in (u.get("attributes", {}) for u in items)
+                if q in a.get("username", "").lower() or q in a.get("email", "").lower()]
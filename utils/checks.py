@@ -1,13 +1,29 @@
 # utils/checks.py
 import os
-from typing import Callable
+import re
+import discord
 from discord import app_commands
-from discord.ext import commands
 
-ADMIN_IDS = {int(x.strip()) for x in os.environ.get("ADMIN_IDS", "").split(",") if x.strip().isdigit()}
+ADMIN_IDS: frozenset[int] = frozenset(int(x) for x in re.findall(r"\d+", os.environ.get("ADMIN_IDS", "")))
+
+# Each admin may run a given command at most ADMIN_RATE times per ADMIN_PER seconds
+ADMIN_RATE = 5
+ADMIN_PER = 10.0
+
+async def _is_admin(interaction: discord.Interaction) -> bool:
+    # Defer first so a slow start or busy event loop can't blow Discord's 3s response window;
+    # handlers guarded by this check must reply through interaction.followup
+    if not interaction.response.is_done():
+        await interaction.response.defer(ephemeral=True)
+    return interaction.user.id in ADMIN_IDS
+
+def _user_key(interaction: discord.Interaction) -> int:
+    return interaction.user.id
 
 def admin_check():
-    """Require executor to be in ADMIN_IDS"""
-    def predicate(interaction: commands.Context):
-        return interaction.user.id in ADMIN_IDS
-    return app_commands.check(predicate)
+    """Defer the response, then require executor to be in ADMIN_IDS"""
+    return app_commands.check(_is_admin)
+
+def admin_cooldown():
+    """Fixed-window rate limit per (command, user) so bursts can't hammer the panel"""
+    return app_commands.checks.cooldown(ADMIN_RATE, ADMIN_PER, key=_user_key)
@@ -0,0 +1,18 @@
+# utils/mixins.py
+from typing import Any, Awaitable, Optional
+
+import discord
+
+from utils.api import PteroError
+
+class PteroCallMixin:
+    """Helpers for cogs that call the panel; expects `self.embed` to be an EmbedFactory."""
+
+    async def _safe(self, interaction: discord.Interaction, awaitable: Awaitable[Any], err_prefix: str) -> Optional[Any]:
+        """Await a PteroAPI call. On PteroError, reply with an error embed and return None."""
+        try:
+            return await awaitable
+        except PteroError as e:
+            await interaction.followup.send(embed=self.embed.error(f"{err_prefix}: {e}"), ephemeral=True)
+            return None
+